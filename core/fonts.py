@@ -47,7 +47,13 @@ def register_watermark_font(
 
     font_path가 없으면 번들·환경 변수 경로를 탐색한다.
     실패 시 Helvetica(한글 깨짐 가능).
+
+    reportlab 등록은 이름 기준이라 같은 이름으로 다시 등록해도 반영되지 않으므로,
+    이미 등록된 이름이면 TTF를 다시 파싱(수백 ms)하지 않고 바로 반환한다.
     """
+    if font_register_name in pdfmetrics.getRegisteredFontNames():
+        return font_register_name
+
     path = font_path or resolve_bundled_font_path()
     if path is None:
         return FALLBACK_FONT_NAME
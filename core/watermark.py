@@ -1,12 +1,23 @@
 """PDF 워터마크·메타데이터·암호화."""
 
 import io
+import mmap
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import BinaryIO, Callable, Union
+from typing import BinaryIO, Callable, Iterator, Union
 
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
-from pypdf import PdfReader, PdfWriter
+from pypdf import PageObject, PdfReader, PdfWriter
+from pypdf.generic import (
+    ArrayObject,
+    DecodedStreamObject,
+    DictionaryObject,
+    IndirectObject,
+    NameObject,
+    StreamObject,
+)
 
 from core.config import (
     DEFAULT_WATERMARK_ALPHA,
@@ -23,11 +34,16 @@ from core.config import (
 from core.fonts import register_watermark_font
 
 PathLike = Union[str, Path]
-PdfSource = Union[PathLike, BinaryIO]
+PdfSource = Union[PathLike, BinaryIO, PdfReader]
 PdfSink = Union[PathLike, BinaryIO]
 
 ProgressCallback = Callable[[int, int, str], None]
 
+WATERMARK_XOBJECT_NAME = "/PdfSecureWatermark"
+
+# PdfWriter는 객체마다 작은 write()를 반복하므로 출력 파일 버퍼를 크게 잡는다.
+_OUTPUT_BUFFER_SIZE = 1 << 20  # 1 MiB
+
 
 def build_watermark_layer(
     watermark_text: str,
@@ -50,15 +66,105 @@ def build_watermark_layer(
     return packet
 
 
-def _open_reader(source: PdfSource) -> PdfReader:
-    if isinstance(source, (str, Path)):
-        return PdfReader(str(source))
-    return PdfReader(source)
+def _stream_object(writer: PdfWriter, data: bytes) -> IndirectObject:
+    stream = DecodedStreamObject()
+    stream.set_data(data)
+    return writer._add_object(stream)
+
+
+@lru_cache(maxsize=32)
+def _watermark_form(watermark_text: str, font_name: str, font_size: int) -> StreamObject:
+    """
+    워터마크 Form XObject를 한 번만 만들어 둔다.
+
+    reportlab 출력 파싱·콘텐츠 압축은 여기서 한 번만 하고, 결과는 메모리상의
+    별도 PdfWriter에 두어 작업마다 clone만 한다 (원본 스트림을 다시 읽지 않음).
+    """
+    watermark_page = PdfReader(
+        build_watermark_layer(watermark_text, font_name, font_size)
+    ).pages[0]
+    holder = PdfWriter()
+    form = DecodedStreamObject()
+    form.set_data(watermark_page.get_contents().get_data())
+    form.update(
+        {
+            NameObject("/Type"): NameObject("/XObject"),
+            NameObject("/Subtype"): NameObject("/Form"),
+            NameObject("/BBox"): ArrayObject(watermark_page.mediabox),
+            NameObject("/Resources"): watermark_page["/Resources"].clone(holder),
+        }
+    )
+    return holder._add_object(form.flate_encode()).get_object()
+
+
+class _WatermarkStamper:
+    """
+    대상 페이지에 워터마크 XObject 참조만 추가한다.
+
+    merge_page처럼 페이지 콘텐츠 스트림을 파싱·재작성하지 않고,
+    공유된 "q" / "Q ... Do" 스트림으로 원본 콘텐츠를 감싸 /Contents 배열에 붙인다.
+    """
+
+    def __init__(self, writer: PdfWriter, form: StreamObject) -> None:
+        self._xobject = form.clone(writer).indirect_reference
+        self._prefix = _stream_object(writer, b"q\n")
+        self._suffix = _stream_object(
+            writer, f"\nQ\nq {WATERMARK_XOBJECT_NAME} Do Q\n".encode("ascii")
+        )
+
+    def stamp(self, page: PageObject) -> None:
+        resources = page.get_inherited("/Resources", None)
+        resources = (
+            DictionaryObject() if resources is None else DictionaryObject(resources.get_object())
+        )
+        xobjects = resources.get("/XObject")
+        xobjects = (
+            DictionaryObject() if xobjects is None else DictionaryObject(xobjects.get_object())
+        )
+        xobjects[NameObject(WATERMARK_XOBJECT_NAME)] = self._xobject
+        resources[NameObject("/XObject")] = xobjects
+        page[NameObject("/Resources")] = resources
+
+        contents = page.get("/Contents")
+        if contents is None:
+            original = []
+        elif isinstance(contents.get_object(), ArrayObject):
+            original = list(contents.get_object())
+        else:
+            original = [contents]
+        page[NameObject("/Contents")] = ArrayObject(
+            [self._prefix, *original, self._suffix]
+        )
+
+
+@contextmanager
+def _open_reader(source: PdfSource) -> Iterator[PdfReader]:
+    """
+    경로 입력은 메모리 매핑해서 읽는다.
+
+    PdfReader에 경로를 넘기면 파일 전체를 BytesIO로 복사하므로,
+    대용량 PDF는 mmap으로 페이지 캐시를 직접 참조한다.
+    """
+    if isinstance(source, PdfReader):
+        # 미리 파싱해 둔 reader (데스크톱 GUI의 파일 선택 직후 파싱)
+        yield source
+        return
+    if not isinstance(source, (str, Path)):
+        yield PdfReader(source)
+        return
+
+    with open(source, "rb") as stream:
+        # 빈 파일은 mmap할 수 없으므로 pypdf의 오류 메시지를 그대로 받는다.
+        if not stream.seek(0, io.SEEK_END):
+            yield PdfReader(stream)
+            return
+        with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield PdfReader(mapped)
 
 
 def _write_output(writer: PdfWriter, sink: PdfSink) -> None:
     if isinstance(sink, (str, Path)):
-        with open(sink, "wb") as stream:
+        with open(sink, "wb", buffering=_OUTPUT_BUFFER_SIZE) as stream:
             writer.write(stream)
     else:
         writer.write(sink)
@@ -84,64 +190,66 @@ def add_watermark(
     start_page_index = page_number_to_index(watermark_start_page)
     font_name = register_watermark_font()
 
-    watermark_packet = build_watermark_layer(watermark_text, font_name)
-    watermark_page = PdfReader(watermark_packet).pages[0]
-
-    existing_pdf = _open_reader(input_pdf)
-    output = PdfWriter()
-
-    total_pages = len(existing_pdf.pages)
-    if progress_callback:
-        progress_callback(0, total_pages, "PDF 읽기 완료")
-
-    indices_to_watermark = set(
-        watermark_page_indices(total_pages, start_page_index)
+    watermark_form = _watermark_form(
+        watermark_text, font_name, DEFAULT_WATERMARK_FONT_SIZE
     )
 
-    for i in range(total_pages):
-        page = existing_pdf.pages[i]
-        if i in indices_to_watermark:
-            page.merge_page(watermark_page)
-        output.add_page(page)
+    with _open_reader(input_pdf) as existing_pdf:
+        output = PdfWriter()
+        # 페이지별 add_page 대신 한 번에 가져온 뒤 writer 쪽 페이지에 직접 병합
+        output.append(existing_pdf, import_outline=False)
 
+        total_pages = len(output.pages)
         if progress_callback:
-            progress_callback(
-                i + 1, total_pages, f"페이지 처리 중: {i + 1}/{total_pages}"
+            progress_callback(0, total_pages, "PDF 읽기 완료")
+
+        if buyer_name or buyer_phone:
+            if progress_callback:
+                progress_callback(0, total_pages, "메타데이터 설정 중...")
+
+            # 메타데이터는 페이지 처리와 무관하므로 페이지 병합 전에 설정한다.
+            # add_metadata는 기존 항목에 병합하므로 원본 정보를 복사하지 않고 바로 넘긴다.
+            if existing_pdf.metadata:
+                output.add_metadata(existing_pdf.metadata)
+            output.add_metadata(
+                {
+                    "/Author": METADATA_AUTHOR,
+                    "/Subject": f"구매자 정보: {buyer_name or ''} ({buyer_phone or ''})",
+                    "/Creator": METADATA_CREATOR,
+                    "/Producer": "",
+                }
             )
 
-    if buyer_name or buyer_phone:
-        if progress_callback:
-            progress_callback(total_pages, total_pages, "메타데이터 설정 중...")
-
-        metadata = {}
-        if hasattr(existing_pdf, "metadata") and existing_pdf.metadata:
-            metadata = existing_pdf.metadata.copy()
-
-        metadata.update(
-            {
-                "/Author": METADATA_AUTHOR,
-                "/Subject": f"구매자 정보: {buyer_name or ''} ({buyer_phone or ''})",
-                "/Creator": METADATA_CREATOR,
-                "/Producer": "",
-            }
+        indices_to_watermark = set(
+            watermark_page_indices(total_pages, start_page_index)
         )
-        output.add_metadata(metadata)
 
-    if password:
-        if progress_callback:
-            progress_callback(
-                total_pages, total_pages, "비밀번호 및 권한 설정 중..."
+        stamper = _WatermarkStamper(output, watermark_form)
+        for i in range(total_pages):
+            if i in indices_to_watermark:
+                stamper.stamp(output.pages[i])
+
+            if progress_callback:
+                progress_callback(
+                    i + 1, total_pages, f"페이지 처리 중: {i + 1}/{total_pages}"
+                )
+
+        if password:
+            if progress_callback:
+                progress_callback(
+                    total_pages, total_pages, "비밀번호 및 권한 설정 중..."
+                )
+            output.encrypt(
+                user_password=password,
+                owner_password=password,
+                algorithm="AES-128",
             )
-        output.encrypt(
-            user_password=password,
-            owner_password=password,
-            use_128bit=True,
-        )
 
-    if progress_callback:
-        progress_callback(total_pages, total_pages, "파일 저장 중...")
+        if progress_callback:
+            progress_callback(total_pages, total_pages, "파일 저장 중...")
 
-    _write_output(output, output_pdf)
+        # 출력 시 원본 스트림을 다시 읽을 수 있으므로 저장까지 매핑을 유지한다.
+        _write_output(output, output_pdf)
 
     if progress_callback:
         progress_callback(total_pages, total_pages, "완료!")
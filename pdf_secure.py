@@ -1,10 +1,12 @@
+import multiprocessing
 import os
 import platform
+import queue
+import re
 import sys
-import threading
+import time
 
 from core.password import PdfPasswordValidationError, validate_pdf_password
-from core.watermark import add_watermark
 
 # --- GUI 인터페이스 ---
 import tkinter as tk
@@ -27,10 +29,12 @@ if platform.system() == 'Darwin':  # macOS
                 'TSM AdjustCapsLockLED',
                 'mach port for IMKCFRunLoopWakeUpReliable'
             ]
+            # 키워드마다 부분 문자열 검색을 반복하지 않도록 하나의 패턴으로 컴파일
+            self._pattern = re.compile('|'.join(map(re.escape, self.filter_keywords)))
         
         def write(self, message):
             # 필터링할 키워드가 포함된 메시지는 무시
-            if any(keyword in message for keyword in self.filter_keywords):
+            if self._pattern.search(message):
                 return
             # 실제 에러는 그대로 출력
             self.original_stderr.write(message)
@@ -41,6 +45,74 @@ if platform.system() == 'Darwin':  # macOS
     # stderr를 필터링된 버전으로 교체
     sys.stderr = StderrFilter(sys.stderr)
 
+def __getattr__(name):
+    """reportlab·pypdf 로딩은 GUI 시작을 늦추므로 add_watermark를 처음 쓸 때 import"""
+    if name == "add_watermark":
+        from core.watermark import add_watermark
+        return add_watermark
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+PROGRESS_MIN_INTERVAL = 0.05  # 초
+
+def _make_progress_sender(result_queue):
+    """
+    페이지마다 큐에 넣지 않도록 진행 상황 전달을 줄이는 콜백 생성
+    (1% 단위 또는 50ms 경과 시, 그리고 단계 메시지는 항상 전달)
+    """
+    last_sent = 0.0
+    
+    def send(current, total, message):
+        nonlocal last_sent
+        now = time.monotonic()
+        step = max(1, total // 100)
+        if (current < total and current % step
+                and now - last_sent < PROGRESS_MIN_INTERVAL):
+            return
+        last_sent = now
+        result_queue.put(("progress", current, total, message))
+    
+    return send
+
+def _process_pdf_worker(command_queue, result_queue, input_path):
+    """
+    PDF 처리 작업 (별도 프로세스에서 실행)
+    CPU 작업이 GUI 스레드와 GIL을 다투지 않도록 프로세스로 분리하고,
+    진행 상황·결과는 큐로 전달
+    
+    파일 선택 직후 시작되어 라이브러리 로딩·PDF 파싱을 미리 해 두고,
+    "처리 시작" 시 command_queue로 작업 정보를 받는다.
+    """
+    try:
+        # PDF 처리 (reportlab·pypdf는 여기서 처음 로딩)
+        from pypdf import PdfReader
+        from core.watermark import add_watermark
+        # 경로로 열면 pypdf가 파일 전체를 메모리로 읽고 바로 닫으므로,
+        # 대기 중에도 원본 파일을 잠그거나(Windows) 덮어쓰기에 영향받지 않음
+        reader = PdfReader(input_path)
+        
+        command = command_queue.get()
+        output_path, watermark_text, pdf_password, buyer_name, buyer_phone = command
+        success = add_watermark(
+            reader, 
+            output_path, 
+            watermark_text, 
+            password=pdf_password,
+            buyer_name=buyer_name,
+            buyer_phone=buyer_phone,
+            progress_callback=_make_progress_sender(result_queue)
+        )
+        result_queue.put(("done", success))
+    except Exception as e:
+        result_queue.put(("error", str(e)))
+
+def _file_signature(path):
+    """파일 변경 감지용 (수정 시각, 크기). 읽을 수 없으면 None"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
 class PDFSecureGUI:
     def __init__(self, root):
         self.root = root
@@ -56,6 +128,13 @@ class PDFSecureGUI:
         self.progress_var = tk.DoubleVar()
         self.status_var = tk.StringVar(value="준비")
         
+        # 파일 선택 시 미리 시작하는 작업 프로세스
+        self._worker = None
+        self._worker_input = None
+        self._worker_signature = None
+        self._command_queue = None
+        self._result_queue = None
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -77,8 +156,9 @@ class PDFSecureGUI:
                                    font=("맑은 고딕", 11), state='readonly')
         self.file_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 8))
         
-        tk.Button(file_select_frame, text="파일 선택", command=self.select_file,
-                 font=("맑은 고딕", 11)).pack(side=tk.LEFT)
+        self.file_button = tk.Button(file_select_frame, text="파일 선택", command=self.select_file,
+                                     font=("맑은 고딕", 11))
+        self.file_button.pack(side=tk.LEFT)
         
         # 구매자 정보 입력 프레임
         info_frame = tk.Frame(self.root)
@@ -185,6 +265,26 @@ class PDFSecureGUI:
         )
         if filename:
             self.input_file.set(filename)
+            # "처리 시작" 전에 PDF 파싱을 끝내 두도록 작업 프로세스를 미리 시작
+            self._start_worker(filename)
+    
+    def _start_worker(self, input_path):
+        """입력 파일을 미리 파싱하는 작업 프로세스 시작 (이전 프로세스는 종료)"""
+        if self._worker is not None and self._worker.is_alive():
+            # 아직 파싱 중일 수 있으므로 기다리지 않고 바로 종료
+            self._worker.terminate()
+            self._worker.join()
+        
+        self._worker_input = input_path
+        self._worker_signature = _file_signature(input_path)
+        self._command_queue = multiprocessing.Queue()
+        self._result_queue = multiprocessing.Queue()
+        self._worker = multiprocessing.Process(
+            target=_process_pdf_worker,
+            args=(self._command_queue, self._result_queue, input_path),
+            daemon=True
+        )
+        self._worker.start()
     
     def update_preview(self):
         """이름과 연락처 입력에 따라 미리보기 업데이트"""
@@ -234,71 +334,113 @@ class PDFSecureGUI:
             progress = (current / total) * 100
             self.progress_var.set(progress)
         self.status_var.set(message)
-        self.root.update_idletasks()
     
     def process_pdf(self):
-        """PDF 처리 작업 (별도 스레드에서 실행)"""
-        try:
-            input_path = self.input_file.get()
-            buyer_name = self.buyer_name.get().strip()
-            buyer_phone = self.buyer_phone.get().strip()
-            pdf_password = self.pdf_password.get().strip()
-            
-            # 출력 파일명 생성
-            input_dir = os.path.dirname(input_path)
-            input_basename = os.path.splitext(os.path.basename(input_path))[0]
-            output_filename = f"{input_basename}_{buyer_name}.pdf"
-            output_path = os.path.join(input_dir, output_filename)
-            
-            # 워터마크 텍스트 생성
-            watermark_text = f"이 책은 {buyer_name} ({buyer_phone}) 님이 구매하신 전자책입니다."
-            
-            # PDF 처리
-            success = add_watermark(
-                input_path, 
-                output_path, 
-                watermark_text, 
-                password=pdf_password,
-                buyer_name=buyer_name,
-                buyer_phone=buyer_phone,
-                progress_callback=self.progress_callback
-            )
+        """PDF 처리 작업 시작 (별도 프로세스에서 실행)"""
+        input_path = self.input_file.get()
+        buyer_name = self.buyer_name.get().strip()
+        buyer_phone = self.buyer_phone.get().strip()
+        pdf_password = self.pdf_password.get().strip()
+        
+        # 출력 파일명 생성
+        input_dir = os.path.dirname(input_path)
+        input_basename = os.path.splitext(os.path.basename(input_path))[0]
+        output_filename = f"{input_basename}_{buyer_name}.pdf"
+        output_path = os.path.join(input_dir, output_filename)
+        
+        # 워터마크 텍스트 생성
+        watermark_text = f"이 책은 {buyer_name} ({buyer_phone}) 님이 구매하신 전자책입니다."
+        
+        self._output_filename = output_filename
+        self._pdf_password = pdf_password
+        # 미리 시작한 프로세스가 없거나 이미 끝났으면 새로 시작
+        # (파싱 오류로 종료된 경우에도 다시 시작해 오류를 그대로 받음)
+        # 미리 파싱한 뒤 파일이 바뀐 경우에도 다시 시작해 새 내용을 파싱
+        if (self._worker is None or not self._worker.is_alive()
+                or self._worker_input != input_path
+                or self._worker_signature != _file_signature(input_path)):
+            self._start_worker(input_path)
+        self._command_queue.put(
+            (output_path, watermark_text, pdf_password, buyer_name, buyer_phone)
+        )
+        self.root.after(50, self._poll_queue)
+    
+    def _poll_queue(self):
+        """작업 프로세스의 진행 상황·결과를 메인 스레드에서 반영"""
+        # 큐를 비우기 전에 생존 여부를 확인해야 종료 직전 결과를 놓치지 않음
+        worker_alive = self._worker.is_alive()
+        # 한 번의 폴링에서는 마지막 진행 상황만 화면에 반영
+        latest_progress = None
+        while True:
+            try:
+                event = self._result_queue.get_nowait()
+            except queue.Empty:
+                break
             
-            if success:
-                messagebox.showinfo("완료", 
-                                  f"파일이 생성되었습니다!\n\n"
-                                  f"파일: {output_filename}\n"
-                                  f"비밀번호: {pdf_password}")
-                # 초기화
-                self.progress_var.set(0)
-                self.status_var.set("준비")
-                self.process_button.config(state=tk.NORMAL)
-            else:
-                messagebox.showerror("오류", "PDF 처리 중 오류가 발생했습니다.")
-                self.process_button.config(state=tk.NORMAL)
-                
-        except Exception as e:
-            messagebox.showerror("오류", f"처리 중 오류가 발생했습니다:\n{str(e)}")
+            kind = event[0]
+            if kind == "progress":
+                latest_progress = event[1:]
+            elif kind == "done":
+                self._finish_processing(event[1])
+                return
+            elif kind == "error":
+                self._fail_processing(event[1])
+                return
+        
+        if latest_progress is not None:
+            self.progress_callback(*latest_progress)
+        
+        if not worker_alive:
+            # 결과를 남기지 못하고 종료된 경우 (강제 종료 등)
+            self._fail_processing(f"작업 프로세스가 비정상 종료되었습니다. (코드: {self._worker.exitcode})")
+            return
+        self.root.after(50, self._poll_queue)
+    
+    def _finish_processing(self, success):
+        if success:
+            messagebox.showinfo("완료", 
+                              f"파일이 생성되었습니다!\n\n"
+                              f"파일: {self._output_filename}\n"
+                              f"비밀번호: {self._pdf_password}")
+            # 초기화
             self.progress_var.set(0)
-            self.status_var.set("오류 발생")
+            self.status_var.set("준비")
+            self.process_button.config(state=tk.NORMAL)
+            self.file_button.config(state=tk.NORMAL)
+        else:
+            messagebox.showerror("오류", "PDF 처리 중 오류가 발생했습니다.")
             self.process_button.config(state=tk.NORMAL)
+            self.file_button.config(state=tk.NORMAL)
+    
+    def _fail_processing(self, error):
+        messagebox.showerror("오류", f"처리 중 오류가 발생했습니다:\n{error}")
+        self.progress_var.set(0)
+        self.status_var.set("오류 발생")
+        self.process_button.config(state=tk.NORMAL)
+        self.file_button.config(state=tk.NORMAL)
     
     def start_processing(self):
         """처리 시작"""
         if not self.validate_inputs():
             return
         
-        # 버튼 비활성화
+        # 버튼 비활성화 (처리 중 파일을 바꾸면 작업 프로세스가 교체되므로 파일 선택도 막음)
         self.process_button.config(state=tk.DISABLED)
+        self.file_button.config(state=tk.DISABLED)
         self.progress_var.set(0)
         self.status_var.set("처리 시작...")
         
-        # 별도 스레드에서 처리 (GUI 블로킹 방지)
-        thread = threading.Thread(target=self.process_pdf, daemon=True)
-        thread.start()
+        # 별도 프로세스에서 처리 (GUI 블로킹·GIL 경합 방지)
+        try:
+            self.process_pdf()
+        except Exception as e:
+            # 프로세스 시작 실패 등 — 버튼이 비활성화된 채 남지 않도록 처리
+            self._fail_processing(str(e))
 
 # --- 실행부 ---
 if __name__ == "__main__":
+    # PyInstaller 단일 실행 파일에서 작업 프로세스 실행 지원
+    multiprocessing.freeze_support()
     root = tk.Tk()
     app = PDFSecureGUI(root)
     root.mainloop()
\ No newline at end of file
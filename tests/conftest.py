@@ -24,6 +24,28 @@ def two_page_pdf(tmp_path) -> Path:
     return path
 
 
+@pytest.fixture
+def spy_calls(monkeypatch):
+    """
+    target.name을 호출 기록용 래퍼로 바꾸고 호출 인자 목록을 반환하는 함수.
+
+    예: calls = spy_calls(pdfmetrics, "registerFont")
+    """
+
+    def spy(target, name: str) -> list[tuple]:
+        calls: list[tuple] = []
+        original = getattr(target, name)
+
+        def wrapper(*args, **kwargs):
+            calls.append(args)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(target, name, wrapper)
+        return calls
+
+    return spy
+
+
 def _write_multipage_pdf(path: Path, page_count: int) -> None:
     c = canvas.Canvas(str(path), pagesize=A4)
     for i in range(page_count):
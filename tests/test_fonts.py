@@ -54,6 +54,24 @@ class TestRegisterWatermarkFont:
         assert name == unique_name
         assert unique_name in pdfmetrics.getRegisteredFontNames()
 
+    def test_registers_only_once_per_name(self, fonts_dir, spy_calls):
+        if not BUNDLED_FONT.is_file():
+            pytest.skip("assets/fonts/NanumGothic.ttf 없음")
+        fonts_dir.mkdir(parents=True, exist_ok=True)
+        other = fonts_dir / "other.ttf"
+        other.write_bytes(BUNDLED_FONT.read_bytes())
+        calls = spy_calls(pdfmetrics, "registerFont")
+        unique_name = "NanumGothicTestOnce"
+        for path in (BUNDLED_FONT, BUNDLED_FONT, other):
+            assert (
+                register_watermark_font(
+                    font_path=path,
+                    font_register_name=unique_name,
+                )
+                == unique_name
+            )
+        assert len(calls) == 1
+
     def test_missing_file_returns_helvetica(self, fonts_dir):
         missing = fonts_dir / "nope.ttf"
         assert register_watermark_font(font_path=missing) == FALLBACK_FONT_NAME
@@ -36,3 +36,36 @@ class TestPdfSecureReexport:
         )
         assert result is True
         assert len(PdfReader(str(out)).pages) == 6
+
+
+class _ListQueue:
+    def __init__(self):
+        self.items = []
+
+    def put(self, item):
+        self.items.append(item)
+
+
+class TestProgressSender:
+    def test_throttles_page_progress_but_keeps_stage_messages(self, monkeypatch):
+        pdf_secure = importlib.import_module("pdf_secure")
+        now = [0.0]
+        monkeypatch.setattr(pdf_secure.time, "monotonic", lambda: now[0])
+        queue = _ListQueue()
+        send = pdf_secure._make_progress_sender(queue)
+
+        send(0, 1000, "PDF 읽기 완료")
+        send(0, 1000, "메타데이터 설정 중...")
+        now[0] = 0.01
+        send(1, 1000, "페이지 처리 중: 1/1000")  # 1% 미만·50ms 미만 → 생략
+        send(10, 1000, "페이지 처리 중: 10/1000")  # 1% 단위 → 전달
+        now[0] = 0.07
+        send(11, 1000, "페이지 처리 중: 11/1000")  # 50ms 경과 → 전달
+        now[0] = 0.08
+        send(12, 1000, "페이지 처리 중: 12/1000")  # 생략
+        send(1000, 1000, "페이지 처리 중: 1000/1000")
+        send(1000, 1000, "완료!")
+
+        assert [item[1] for item in queue.items] == [0, 0, 10, 11, 1000, 1000]
+        assert queue.items[1][3] == "메타데이터 설정 중..."
+        assert queue.items[-1] == ("progress", 1000, 1000, "완료!")
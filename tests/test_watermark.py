@@ -7,7 +7,11 @@ import pytest
 from pypdf import PdfReader
 
 from core.config import page_number_to_index
-from core.watermark import add_watermark, build_watermark_layer
+from core.watermark import (
+    WATERMARK_XOBJECT_NAME,
+    add_watermark,
+    build_watermark_layer,
+)
 from core.fonts import register_watermark_font
 from core.config import PROJECT_ROOT
 from tests.conftest import count_merge_operations
@@ -58,6 +62,46 @@ class TestAddWatermark:
         # 출력이 생성되고 페이지 수 유지
         assert len(PdfReader(str(out)).pages) == 6
 
+    def test_watermark_text_only_on_pages_from_start(
+        self, sample_multipage_pdf, tmp_path, font_name
+    ):
+        out = tmp_path / "out_text.pdf"
+        add_watermark(sample_multipage_pdf, out, WATERMARK_TEXT)
+        pages = PdfReader(str(out)).pages
+        has_watermark = ["구매하신" in page.extract_text() for page in pages]
+        assert has_watermark == [False, False, False, False, True, True]
+
+    def test_embeds_only_font_subset(self, sample_multipage_pdf, tmp_path, font_name):
+        """reportlab은 사용한 글리프만 임베드 — 전체 폰트 크기만큼 커지지 않음."""
+        out = tmp_path / "out_subset.pdf"
+        add_watermark(sample_multipage_pdf, out, WATERMARK_TEXT)
+        growth = out.stat().st_size - sample_multipage_pdf.stat().st_size
+        assert growth < BUNDLED_FONT.stat().st_size // 10
+
+    def test_renders_watermark_once_for_same_text(
+        self, two_page_pdf, tmp_path, font_name, spy_calls
+    ):
+        import core.watermark as watermark_module
+
+        calls = spy_calls(watermark_module, "build_watermark_layer")
+        text = "이 책은 캐시 (010-0000) 님이 구매하신 전자책입니다."
+        for name in ("first.pdf", "second.pdf"):
+            add_watermark(two_page_pdf, tmp_path / name, text)
+        assert len(calls) == 1
+
+    def test_pages_share_one_watermark_xobject(
+        self, sample_multipage_pdf, tmp_path, font_name
+    ):
+        out = tmp_path / "out_xobj.pdf"
+        add_watermark(sample_multipage_pdf, out, WATERMARK_TEXT)
+        pages = PdfReader(str(out)).pages
+        refs = {
+            pages[i]["/Resources"]["/XObject"].raw_get(WATERMARK_XOBJECT_NAME).idnum
+            for i in (4, 5)
+        }
+        assert len(refs) == 1
+        assert "/XObject" not in pages[0]["/Resources"]
+
     def test_custom_start_page_one_watermarks_all_pages(
         self, two_page_pdf, tmp_path, font_name
     ):
@@ -91,6 +135,20 @@ class TestAddWatermark:
         assert "김철수" in (meta.get("/Subject") or "")
         assert "test@email.com" in (meta.get("/Subject") or "")
 
+    def test_metadata_keeps_original_fields(self, sample_multipage_pdf, tmp_path, font_name):
+        out = tmp_path / "out_meta_keep.pdf"
+        add_watermark(
+            sample_multipage_pdf,
+            out,
+            WATERMARK_TEXT,
+            buyer_name="김철수",
+            buyer_phone="010",
+        )
+        original = PdfReader(str(sample_multipage_pdf)).metadata
+        meta = PdfReader(str(out)).metadata
+        assert meta.get("/Title") == original.get("/Title")
+        assert meta.get("/Author") == "올라"
+
     def test_password_encrypts_output(self, sample_multipage_pdf, tmp_path, font_name):
         out = tmp_path / "out_enc.pdf"
         password = "secret123"
@@ -105,6 +163,25 @@ class TestAddWatermark:
         reader.decrypt(password)
         assert len(reader.pages) == 6
 
+    def test_password_uses_aes_128(self, sample_multipage_pdf, tmp_path, font_name):
+        out = tmp_path / "out_aes.pdf"
+        add_watermark(
+            sample_multipage_pdf,
+            out,
+            WATERMARK_TEXT,
+            password="secret123",
+        )
+        encrypt = PdfReader(str(out)).trailer["/Encrypt"].get_object()
+        assert encrypt["/V"] == 4
+        assert encrypt["/CF"]["/StdCF"]["/CFM"] == "/AESV2"
+
+    def test_accepts_preparsed_reader(self, sample_multipage_pdf, tmp_path, font_name):
+        reader = PdfReader(str(sample_multipage_pdf))
+        for name in ("first.pdf", "second.pdf"):
+            out = tmp_path / name
+            add_watermark(reader, out, WATERMARK_TEXT)
+            assert len(PdfReader(str(out)).pages) == 6
+
     def test_writes_to_bytesio_sink(self, sample_multipage_pdf, font_name):
         buffer = io.BytesIO()
         add_watermark(sample_multipage_pdf, buffer, WATERMARK_TEXT)
@@ -127,6 +204,12 @@ class TestAddWatermark:
         assert len(events) > 0
         assert events[-1][2] == "완료!"
 
+    def test_empty_input_file_raises(self, tmp_path, font_name):
+        empty = tmp_path / "empty.pdf"
+        empty.write_bytes(b"")
+        with pytest.raises(Exception, match="empty file"):
+            add_watermark(empty, tmp_path / "out_empty.pdf", WATERMARK_TEXT)
+
     def test_invalid_start_page_raises(self, sample_multipage_pdf, tmp_path, font_name):
         out = tmp_path / "out_bad.pdf"
         with pytest.raises(ValueError, match="1 이상"):